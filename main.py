@@ -1,9 +1,66 @@
+import pandas as pd
 import streamlit as st
 from models.data_classes import BusinessPriority, DeliveryTimeProfile, SiteParameters
 from models.calculations import calculate_reorder_targets
-from simulation.simulator import simulate_days
+from simulation.simulator import simulate_all_scenarios
 from visualization.plots import create_scenario_plot, get_scenario_metrics
 
+@st.cache_data(ttl=3600, max_entries=128)
+def get_reorder_targets(params: SiteParameters) -> dict:
+    """Cached wrapper so unchanged parameters skip the recalculation on rerun"""
+    return calculate_reorder_targets(params)
+
+@st.cache_data(
+    max_entries=32,
+    hash_funcs={pd.DataFrame: lambda df: pd.util.hash_pandas_object(df).values.tobytes()}
+)
+def get_scenario_plot(sim_data: pd.DataFrame, orders, scenario_name: str):
+    """Cached wrapper so an unchanged simulation skips figure construction"""
+    return create_scenario_plot(sim_data, orders, scenario_name)
+
+@st.cache_data(ttl=3600, max_entries=32)
+def get_simulations(params: SiteParameters, reorder_point: float) -> dict:
+    """Cached wrapper so unchanged parameters skip re-simulation on rerun"""
+    return simulate_all_scenarios(params, reorder_point)
+
+@st.fragment
+def render_scenarios(params: SiteParameters, results: dict):
+    """Scenario tabs as a fragment so tab events don't rerun the whole app"""
+    scenarios = {
+        "Expected Case": "expected",
+        "Best Case": "best_case",
+        "Worst Case": "worst_case"
+    }
+
+    tabs = st.tabs(list(scenarios.keys()))
+
+    simulations = get_simulations(params, results['reorder_point'])
+
+    for tab, (scenario_name, scenario_type) in zip(tabs, scenarios.items()):
+        with tab:
+            sim_data, orders = simulations[scenario_type]
+
+            fig = get_scenario_plot(sim_data, orders, scenario_name)
+            st.plotly_chart(fig, use_container_width=True)
+
+            metrics = get_scenario_metrics(sim_data, orders)
+
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Average Inventory",
+                         f"{metrics['average_inventory']:,} gal",
+                         f"{metrics['average_inventory']/30000:.1f} railcars")
+            with col2:
+                st.metric("Total Railcars Ordered", f"{metrics['total_railcars']}")
+            with col3:
+                st.metric("Near Stockouts", f"{metrics['near_stockouts']} days")
+
+            # Add scenario-specific insights
+            if metrics['near_stockouts'] > results['expected_stockout_days_per_year']:
+                st.warning(f"⚠️ This scenario shows more stockouts than expected. Consider increasing safety stock.")
+            if metrics['average_inventory'] > 2 * results['reorder_point']:
+                st.info("💡 Average inventory seems high. Consider more aggressive settings to reduce holding costs.")
+
 def format_recommendation(reorder_point: float, railcar_capacity: float = 30000) -> str:
     """Format the recommendation in railcar terms"""
     railcars = max(1, round(reorder_point / railcar_capacity, 1))
@@ -82,7 +139,7 @@ def main():
     )
 
     # Calculate targets
-    results = calculate_reorder_targets(params)
+    results = get_reorder_targets(params)
 
     # Display the main recommendation prominently
     st.markdown(format_recommendation(results['reorder_point']))
@@ -104,40 +161,8 @@ def main():
 
     # Simulation and visualization
     st.markdown("### Simulation Results")
-    
-    scenarios = {
-        "Expected Case": "expected",
-        "Best Case": "best_case",
-        "Worst Case": "worst_case"
-    }
-    
-    tabs = st.tabs(list(scenarios.keys()))
-    
-    for tab, (scenario_name, scenario_type) in zip(tabs, scenarios.items()):
-        with tab:
-            sim_data, orders = simulate_days(params, results['reorder_point'], 
-                                          scenario=scenario_type)
-            
-            fig = create_scenario_plot(sim_data, orders, scenario_name)
-            st.plotly_chart(fig, use_container_width=True)
-            
-            metrics = get_scenario_metrics(sim_data, orders)
-            
-            col1, col2, col3 = st.columns(3)
-            with col1:
-                st.metric("Average Inventory", 
-                         f"{metrics['average_inventory']:,} gal",
-                         f"{metrics['average_inventory']/30000:.1f} railcars")
-            with col2:
-                st.metric("Total Railcars Ordered", f"{metrics['total_railcars']}")
-            with col3:
-                st.metric("Near Stockouts", f"{metrics['near_stockouts']} days")
 
-            # Add scenario-specific insights
-            if metrics['near_stockouts'] > results['expected_stockout_days_per_year']:
-                st.warning(f"⚠️ This scenario shows more stockouts than expected. Consider increasing safety stock.")
-            if metrics['average_inventory'] > 2 * results['reorder_point']:
-                st.info("💡 Average inventory seems high. Consider more aggressive settings to reduce holding costs.")
+    render_scenarios(params, results)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
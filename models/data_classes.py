@@ -6,7 +6,13 @@ class BusinessPriority(Enum):
     STANDARD = "standard"          # Occasional runouts ok (95%)
     LOW_MARGIN = "low_margin"      # More frequent runouts ok (90%)
 
-@dataclass
+SERVICE_LEVELS = {
+    BusinessPriority.HIGH: 0.99,         # 99%
+    BusinessPriority.STANDARD: 0.95,     # 95%
+    BusinessPriority.LOW_MARGIN: 0.90    # 90%
+}
+
+@dataclass(frozen=True, slots=True)
 class DeliveryTimeProfile:
     """Parameters describing delivery time characteristics"""
     mean_days: float              # Average delivery time in days
@@ -14,7 +20,7 @@ class DeliveryTimeProfile:
     min_days: float              # Minimum possible delivery time
     max_days: float              # Maximum possible delivery time
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SiteParameters:
     """Parameters describing the site's operational characteristics"""
     business_priority: BusinessPriority
@@ -26,9 +32,4 @@ class SiteParameters:
     
     def get_service_level(self) -> float:
         """Convert business priority to service level percentage"""
-        service_levels = {
-            BusinessPriority.HIGH: 0.99,         # 99%
-            BusinessPriority.STANDARD: 0.95,     # 95%
-            BusinessPriority.LOW_MARGIN: 0.90    # 90%
-        }
-        return service_levels[self.business_priority]
\ No newline at end of file
+        return SERVICE_LEVELS[self.business_priority]
\ No newline at end of file
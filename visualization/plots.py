@@ -1,51 +1,37 @@
 import plotly.graph_objects as go
 import numpy as np
-from typing import Tuple, List
 import pandas as pd
 
-def create_scenario_plot(sim_data: pd.DataFrame, 
-                        orders: List[Tuple], 
-                        scenario_name: str) -> go.Figure:
-    """Create plot for a given scenario"""
+# Base figures built once per scenario and reused across reruns; only the
+# trace data gets swapped on each call
+_base_figures = {}
+
+def _make_base_figure(scenario_name: str) -> go.Figure:
+    """Build the styled trace shells and layout for a scenario figure"""
     fig = go.Figure()
-    
-    # Main inventory line
-    fig.add_trace(go.Scatter(
-        x=sim_data['date'],
-        y=sim_data['inventory'],
-        name='Inventory Level',
-        line=dict(color='blue')
-    ))
-    
-    # Reorder point line
-    fig.add_trace(go.Scatter(
-        x=sim_data['date'],
-        y=sim_data['reorder_point'],
-        name='Reorder Point',
-        line=dict(color='red', dash='dash')
-    ))
-    
-    # Order points
-    if orders:
-        order_dates = [order[0] for order in orders]
-        order_inventories = [sim_data[sim_data['date'] == date]['inventory'].iloc[0] 
-                           for date in order_dates]
-        order_sizes = [order[1] for order in orders]
-        
-        fig.add_trace(go.Scatter(
-            x=order_dates,
-            y=order_inventories,
+
+    # Scattergl renders through WebGL, which handles the redraw-per-rerun
+    # pattern much better than SVG Scatter
+    fig.add_traces([
+        go.Scattergl(
+            name='Inventory Level',
+            line=dict(color='blue')
+        ),
+        go.Scattergl(
+            name='Reorder Point',
+            line=dict(color='red', dash='dash')
+        ),
+        go.Scattergl(
             mode='markers',
             name='Orders Placed',
             marker=dict(
-                size=[size * 10 for size in order_sizes],
                 color='yellow',
                 line=dict(color='black', width=1)
             ),
-            text=[f'{size} railcar(s)' for size in order_sizes],
             hoverinfo='text+y+x'
-        ))
-    
+        )
+    ])
+
     fig.update_layout(
         title=f'Projected Inventory Levels - {scenario_name}',
         xaxis_title='Date',
@@ -53,13 +39,51 @@ def create_scenario_plot(sim_data: pd.DataFrame,
         height=400,
         hovermode='x unified'
     )
-    
+
+    return fig
+
+def create_scenario_plot(sim_data: pd.DataFrame,
+                        orders: np.ndarray,
+                        scenario_name: str) -> go.Figure:
+    """Create plot for a given scenario"""
+    fig = _base_figures.get(scenario_name)
+    if fig is None:
+        fig = _base_figures[scenario_name] = _make_base_figure(scenario_name)
+
+    dates_np = sim_data['date'].to_numpy()
+
+    # Order points
+    if len(orders):
+        order_dates = orders['date']
+        order_sizes = orders['railcars']
+
+        # Dates are sorted, so binary search beats a boolean scan per order
+        order_idx = np.searchsorted(dates_np, order_dates.astype(dates_np.dtype))
+        order_inventories = sim_data['inventory'].to_numpy()[order_idx]
+        order_text = [f'{size} railcar(s)' for size in order_sizes]
+        marker_sizes = order_sizes * 10
+    else:
+        order_dates = order_inventories = marker_sizes = np.array([])
+        order_text = []
+
+    # One batched assignment instead of rebuilding traces and layout
+    with fig.batch_update():
+        fig.data[0].x = dates_np
+        fig.data[0].y = sim_data['inventory'].to_numpy()
+        fig.data[1].x = dates_np
+        fig.data[1].y = sim_data['reorder_point'].to_numpy()
+        fig.data[2].x = order_dates
+        fig.data[2].y = order_inventories
+        fig.data[2].marker.size = marker_sizes
+        fig.data[2].text = order_text
+
     return fig
 
-def get_scenario_metrics(sim_data: pd.DataFrame, orders: List[Tuple]) -> dict:
+def get_scenario_metrics(sim_data: pd.DataFrame, orders: np.ndarray) -> dict:
     """Calculate metrics for a scenario"""
+    inventory = sim_data['inventory'].to_numpy()
     return {
-        'average_inventory': int(np.mean(sim_data['inventory'])),
-        'total_railcars': sum(order[1] for order in orders),
-        'near_stockouts': sum(1 for inv in sim_data['inventory'] if inv <= 1000)
-    }
\ No newline at end of file
+        'average_inventory': int(inventory.mean()),
+        'total_railcars': int(orders['railcars'].sum()) if len(orders) else 0,
+        'near_stockouts': int((inventory <= 1000).sum())
+    }